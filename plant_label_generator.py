@@ -6,8 +6,7 @@ This script reads a CSV file containing plant information and automatically gene
 STL files for 3D printable plant labels using OpenSCAD with robust parameter passing.
 
 Requirements:
-- Python 3.6+
-- pandas library (pip install pandas)
+- Python 3.6+ (standard library only)
 - OpenSCAD installed and accessible from command line
 
 Usage:
@@ -34,26 +33,154 @@ The CSV file should contain the following columns:
 - Height: Label height in mm (optional, defaults to 30mm)
 """
 
-import pandas as pd
+import csv
+import hashlib
+import json
+import math
+import shutil
 import subprocess
+import uuid
 import os
 import sys
 import re
 import argparse
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, NamedTuple, Tuple, Optional, Any
 import logging
 
+# Setup logging once at import, unless the host application already configured it
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+
+# Regex patterns used per plant, compiled once at import time
+_SANITIZE_NONWORD = re.compile(r'[^\w\s-]')
+_SANITIZE_GAP = re.compile(r'[-\s]+')
+_QUOTED = re.compile(r"""(['"])(.*?)\1""", re.DOTALL)
+
+@lru_cache(maxsize=4096)
+def _sanitize_filename(name: str) -> str:
+    # Remove special characters and replace spaces with underscores
+    filename = _SANITIZE_NONWORD.sub('', name)
+    filename = _SANITIZE_GAP.sub('_', filename)
+    return filename.strip('_')
+
+@lru_cache(maxsize=4096)
+def _extract_nickname(common_name: str) -> Tuple[str, str]:
+    # Look for text in single or double quotes like "Maranta 'Lemon Lime'",
+    # stripping quoted text and capturing the first nickname in the same scan
+    nicknames = []
+    
+    def take_nickname(match):
+        nicknames.append(match.group(2))
+        return ""
+    
+    base_name = _QUOTED.sub(take_nickname, common_name)
+    if nicknames:
+        return base_name.strip(), nicknames[0]
+    
+    return common_name, ""
+
+# Characters that must be backslash-escaped inside an OpenSCAD string literal
+_SCAD_STRING_ESCAPES = str.maketrans({'\\': '\\\\', '"': '\\"'})
+
+# Cell contents that mean "no value" (upper-cased), matching the missing-value
+# markers pandas recognised when it was used to read the CSV
+_MISSING_VALUES = frozenset({
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NAN', '1.#IND',
+    '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NAN', 'NONE',
+})
+
+# Boolean spellings accepted in the CSV, mapped to OpenSCAD literals
+_BOOL_MAP = {
+    'TRUE': 'true', '1': 'true', 'YES': 'true', '1.0': 'true',
+    'FALSE': 'false', '0': 'false', 'NO': 'false', '0.0': 'false',
+    # Empty cells and missing values are treated as false
+    **dict.fromkeys(_MISSING_VALUES, 'false'),
+}
+
+def _is_blank(value: Any) -> bool:
+    # Empty CSV cells come back as '' (or None for short rows)
+    return value is None or str(value).strip().upper() in _MISSING_VALUES
+
+def _scad_string(value: Any) -> str:
+    return '"' + str(value).translate(_SCAD_STRING_ESCAPES) + '"'
+
+def _remove_file(path: Any) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+def _link_or_copy(src: Any, dst: Any) -> None:
+    # A hard link shares the data instead of copying it, but needs both
+    # paths on the same filesystem (and one that supports links)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+def _link_into_place(src: Any, dst: Any) -> None:
+    # Link (or copy) next to dst and rename over it, so dst is never half-written
+    # and an existing file there (possibly linked to the cache) is replaced, not written through
+    partial = f"{dst}.tmp"
+    _remove_file(partial)
+    try:
+        _link_or_copy(src, partial)
+        os.replace(partial, dst)
+    except BaseException:
+        _remove_file(partial)
+        raise
+
 class DataValidationError(Exception):
     """Custom exception for data validation errors"""
     pass
 
+class LabelData(NamedTuple):
+    """OpenSCAD values for one label, named after the parameters they feed"""
+    common_name: str
+    filename: str
+    plant_name: str
+    scientific_name: str
+    nickname: str
+    water_drops: int
+    light_type: int
+    show_dry_soil_symbol: str
+    spike_enabled: str
+    enable_hanging_holes: str
+    label_width: float
+    label_height: float
+
+# Per-label -D parameters in command-line order, with how to format each value
+_LABEL_ARGS = (
+    # Plant information parameters
+    ('plant_name', _scad_string),
+    ('scientific_name', _scad_string),
+    ('nickname', _scad_string),
+    # Plant care parameters
+    ('water_drops', str),
+    ('light_type', str),
+    ('show_dry_soil_symbol', str),
+    # Label configuration parameters
+    ('spike_enabled', str),
+    ('enable_hanging_holes', str),
+    ('label_width', str),
+    ('label_height', str),
+)
+
 class PlantLabelGenerator:
     def __init__(self, csv_file: str = "plant_list.csv", template_file: str = "enhanced_plant_labeler.scad"):
         self.csv_file = csv_file
         self.template_file = template_file
         self.output_dir = "generated_labels"
         
+        # Stat the template once; None means it does not exist
+        try:
+            self._template_stat: Optional[os.stat_result] = os.stat(template_file)
+        except OSError:
+            self._template_stat = None
+        
         # OpenSCAD parameter defaults (can be overridden via command line)
         self.openscad_params = {
             # Label dimensions
@@ -97,17 +224,32 @@ class PlantLabelGenerator:
             'font_name': 'Liberation Sans'
         }
         
-        # Create output directory
-        Path(self.output_dir).mkdir(exist_ok=True)
+        # Extra OpenSCAD flags, detected from the installed version in check_openscad()
+        self.openscad_extra_args: List[str] = []
+        
+        # -D flags for openscad_params, formatted once per run
+        self._static_scad_args: Optional[List[str]] = None
+        
+        # Re-render labels even when a cached STL for the same inputs exists
+        self.force = False
+        
+        # Number of concurrent OpenSCAD renders (None = one per CPU core)
+        self.jobs: Optional[int] = None
+        
+        # Content-addressed STL cache, set up per run in generate_all_labels()
+        self._cache_dir: Optional[Path] = None
+        self._template_digest = ''
+        
+        # Which OpenSCAD build renders, recorded by check_openscad() for the cache key
+        self._openscad_identity = ''
         
-        # Setup logging
-        logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
         self.logger = logging.getLogger(__name__)
     
-    def validate_csv_data(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
+    def validate_csv_data(self, rows: List[Dict[str, Any]], columns: List[str]) -> Tuple[List[Dict[str, Any]], List[str]]:
         """
         Comprehensive validation of CSV data with detailed error reporting.
-        Returns cleaned dataframe and list of validation warnings.
+        Returns cleaned rows and list of validation warnings. In the cleaned rows
+        Water/Light are converted to int and Width/Height to float (None if blank).
         """
         warnings = []
         errors = []
@@ -115,38 +257,44 @@ class PlantLabelGenerator:
         # Check required columns
         required_cols = ['Common Name', 'Scientific Name', 'Water', 'Light',
                         'Dry between Waterings', 'Spike', 'Holes']
-        missing_cols = [col for col in required_cols if col not in df.columns]
+        missing_cols = [col for col in required_cols if col not in columns]
         
         if missing_cols:
             raise DataValidationError(f"Missing required columns: {missing_cols}")
         
-        # Validate each row
-        valid_rows = []
-        for index, row in df.iterrows():
+        # Optional dimension columns present in this file, resolved once for all rows
+        dim_fields = [field for field in ['Width', 'Height'] if field in columns]
+        
+        # Validate each row, keeping the first occurrence of each valid plant
+        first_rows = {}
+        duplicate_plants = set()
+        duplicate_count = 0
+        for index, row in enumerate(rows):
             row_errors = []
+            parsed = {}  # Typed values, stored back on the row if it is valid
             
             # Validate Common Name
-            if pd.isna(row['Common Name']) or not str(row['Common Name']).strip():
+            if _is_blank(row['Common Name']):
                 row_errors.append(f"Row {index+1}: Common Name is empty")
             
             # Validate Scientific Name
-            if pd.isna(row['Scientific Name']) or not str(row['Scientific Name']).strip():
+            if _is_blank(row['Scientific Name']):
                 row_errors.append(f"Row {index+1}: Scientific Name is empty")
             
             # Validate Water level (1-4)
             try:
-                water_val = int(row['Water'])
+                water_val = parsed['Water'] = int(float(row['Water']))
                 if not 1 <= water_val <= 4:
                     row_errors.append(f"Row {index+1}: Water level must be 1-4, got {water_val}")
-            except (ValueError, TypeError):
+            except (ValueError, TypeError, OverflowError):
                 row_errors.append(f"Row {index+1}: Water level must be numeric (1-4), got '{row['Water']}'")
             
             # Validate Light level (1-4)
             try:
-                light_val = int(row['Light'])
+                light_val = parsed['Light'] = int(float(row['Light']))
                 if not 1 <= light_val <= 4:
                     row_errors.append(f"Row {index+1}: Light level must be 1-4, got {light_val}")
-            except (ValueError, TypeError):
+            except (ValueError, TypeError, OverflowError):
                 row_errors.append(f"Row {index+1}: Light level must be numeric (1-4), got '{row['Light']}'")
             
             # Validate boolean fields
@@ -155,11 +303,14 @@ class PlantLabelGenerator:
                     row_errors.append(f"Row {index+1}: {bool_field} must be TRUE/FALSE, got '{row[bool_field]}'")
             
             # Validate dimensions if provided
-            for dim_field in ['Width', 'Height']:
-                if dim_field in df.columns and pd.notna(row[dim_field]):
+            parsed['Width'] = parsed['Height'] = None
+            for dim_field in dim_fields:
+                if not _is_blank(row[dim_field]):
                     try:
-                        dim_val = float(row[dim_field])
-                        if dim_val <= 0:
+                        dim_val = parsed[dim_field] = float(row[dim_field])
+                        if not math.isfinite(dim_val):
+                            row_errors.append(f"Row {index+1}: {dim_field} must be a finite number, got '{row[dim_field]}'")
+                        elif dim_val <= 0:
                             row_errors.append(f"Row {index+1}: {dim_field} must be positive, got {dim_val}")
                         elif dim_val > 200:  # Reasonable upper limit
                             warnings.append(f"Row {index+1}: {dim_field} is very large ({dim_val}mm)")
@@ -169,157 +320,185 @@ class PlantLabelGenerator:
             if row_errors:
                 errors.extend(row_errors)
             else:
-                valid_rows.append(row)
+                key = (row['Common Name'], row['Scientific Name'])
+                if key in first_rows:
+                    duplicate_plants.add(key[0])
+                    duplicate_count += 1
+                else:
+                    row.update(parsed)
+                    first_rows[key] = row
         
         if errors:
             raise DataValidationError(f"Data validation failed:\n" + "\n".join(errors))
         
-        # Check for duplicates
-        if len(valid_rows) > 0:
-            clean_df = pd.DataFrame(valid_rows)
-            duplicates = clean_df.duplicated(subset=['Common Name', 'Scientific Name'], keep=False)
-            if duplicates.any():
-                duplicate_plants = clean_df[duplicates]['Common Name'].tolist()
-                warnings.append(f"Found duplicate entries: {set(duplicate_plants)}")
-                # Remove duplicates, keeping first occurrence
-                clean_df = clean_df.drop_duplicates(subset=['Common Name', 'Scientific Name'], keep='first')
-                warnings.append(f"Removed {duplicates.sum() - len(set(duplicate_plants))} duplicate rows")
-        else:
-            clean_df = pd.DataFrame()
+        if duplicate_plants:
+            warnings.append(f"Found duplicate entries: {duplicate_plants}")
+            warnings.append(f"Removed {duplicate_count} duplicate rows")
         
-        return clean_df, warnings
+        return list(first_rows.values()), warnings
     
     def _is_valid_boolean(self, value: Any) -> bool:
         """Check if a value is a valid boolean representation"""
-        if pd.isna(value):
-            return True  # Will be converted to False
-        
-        value_str = str(value).strip().upper()
-        return value_str in ['TRUE', 'FALSE', '1', '0', 'YES', 'NO']
+        # Blank cells are valid and will be converted to False
+        return str(value).strip().upper() in _BOOL_MAP
     
     def convert_boolean_to_openscad(self, value: Any) -> str:
         """Convert various boolean representations to OpenSCAD boolean values"""
-        if pd.isna(value):
-            return "false"
-        
-        value_str = str(value).strip().upper()
-        if value_str in ['TRUE', '1', 'YES']:
-            return "true"
-        elif value_str in ['FALSE', '0', 'NO']:
-            return "false"
-        else:
-            # Handle numeric values for backward compatibility
-            try:
-                numeric_val = float(value)
-                return "true" if numeric_val != 0 else "false"
-            except (ValueError, TypeError):
-                return "false"  # Default to false for invalid values
+        openscad_value = _BOOL_MAP.get(str(value).strip().upper())
+        if openscad_value is not None:
+            return openscad_value
+        
+        # Handle other numeric values for backward compatibility
+        try:
+            numeric_val = float(value)
+            return "true" if numeric_val != 0 else "false"
+        except (ValueError, TypeError):
+            return "false"  # Default to false for invalid values
     
     def sanitize_filename(self, name: str) -> str:
         """Create a safe filename from plant name"""
-        # Remove special characters and replace spaces with underscores
-        filename = re.sub(r'[^\w\s-]', '', name)
-        filename = re.sub(r'[-\s]+', '_', filename)
-        return filename.strip('_')
+        return _sanitize_filename(name)
     
     def extract_nickname(self, common_name: str) -> Tuple[str, str]:
         """Extract nickname from common name if it contains quotes"""
-        # Look for text in single quotes like "Maranta 'Lemon Lime'"
-        quote_match = re.search(r"'([^']*)'", common_name)
-        if quote_match:
-            nickname = quote_match.group(1)
-            base_name = re.sub(r"'[^']*'", "", common_name).strip()
-            return base_name, nickname
-        
-        # Look for text in double quotes
-        quote_match = re.search(r'"([^"]*)"', common_name)
-        if quote_match:
-            nickname = quote_match.group(1)
-            base_name = re.sub(r'"[^"]*"', "", common_name).strip()
-            return base_name, nickname
-        
-        return common_name, ""
-    
-    def build_openscad_command(self, plant_data: pd.Series, output_file: str) -> List[str]:
+        return _extract_nickname(common_name)
+    
+    def format_scad_string(self, value: Any) -> str:
+        """Quote a value as an OpenSCAD string literal, escaping backslashes and quotes"""
+        return _scad_string(value)
+    
+    def prepare_label(self, row: Dict[str, Any]) -> LabelData:
         """
-        Build OpenSCAD command using -D flags for parameter passing.
-        This eliminates the need to modify the .scad file.
+        Convert a validated CSV row into the OpenSCAD values for its label.
+        Fields are named after the OpenSCAD parameters they feed.
         """
+        common_name = row['Common Name']
+        
         # Handle nickname - use dedicated column if available, otherwise extract from common name
-        if 'Nickname' in plant_data and pd.notna(plant_data['Nickname']) and plant_data['Nickname'].strip():
-            nickname = plant_data['Nickname']
-            common_name = plant_data['Common Name']
+        if not _is_blank(row.get('Nickname')):
+            plant_name, nickname = common_name, row['Nickname']
         else:
-            common_name, nickname = self.extract_nickname(plant_data['Common Name'])
-        
-        scientific_name = plant_data['Scientific Name']
-        
-        # Get numeric values for water and light (1-4 scale)
-        water_drops = int(plant_data['Water']) if pd.notna(plant_data['Water']) else 2
-        light_type = int(plant_data['Light']) if pd.notna(plant_data['Light']) else 2
-        
-        # Get boolean values and convert to OpenSCAD format
-        dry_between_waterings = self.convert_boolean_to_openscad(plant_data['Dry between Waterings'])
-        spike_enabled = self.convert_boolean_to_openscad(plant_data['Spike'])
-        enable_hanging_holes = self.convert_boolean_to_openscad(plant_data['Holes'])
+            plant_name, nickname = self.extract_nickname(common_name)
         
         # Get dimensions with defaults
-        label_width = float(plant_data['Width']) if pd.notna(plant_data['Width']) else self.openscad_params['label_width']
-        label_height = float(plant_data['Height']) if pd.notna(plant_data['Height']) else self.openscad_params['label_height']
-        
-        # Build command with -D parameters
-        cmd = ["openscad", "-o", output_file]
-        
-        # Plant information parameters
-        cmd.extend(["-D", f'plant_name="{common_name}"'])
-        cmd.extend(["-D", f'scientific_name="{scientific_name}"'])
-        cmd.extend(["-D", f'nickname="{nickname}"'])
-        
-        # Plant care parameters
-        cmd.extend(["-D", f"water_drops={water_drops}"])
-        cmd.extend(["-D", f"light_type={light_type}"])
-        cmd.extend(["-D", f"show_dry_soil_symbol={dry_between_waterings}"])
-        
-        # Label configuration parameters
-        cmd.extend(["-D", f"spike_enabled={spike_enabled}"])
-        cmd.extend(["-D", f"enable_hanging_holes={enable_hanging_holes}"])
-        cmd.extend(["-D", f"label_width={label_width}"])
-        cmd.extend(["-D", f"label_height={label_height}"])
-        
-        # Add all configurable OpenSCAD parameters
+        width = row['Width']
+        height = row['Height']
+        
+        return LabelData(
+            common_name=common_name,
+            filename=self.sanitize_filename(common_name),
+            plant_name=plant_name,
+            scientific_name=row['Scientific Name'],
+            nickname=nickname,
+            # Water and light levels (1-4 scale)
+            water_drops=row['Water'],
+            light_type=row['Light'],
+            # Boolean values in OpenSCAD format
+            show_dry_soil_symbol=self.convert_boolean_to_openscad(row['Dry between Waterings']),
+            spike_enabled=self.convert_boolean_to_openscad(row['Spike']),
+            enable_hanging_holes=self.convert_boolean_to_openscad(row['Holes']),
+            label_width=float(self.openscad_params['label_width']) if width is None else width,
+            label_height=float(self.openscad_params['label_height']) if height is None else height,
+        )
+    
+    def assign_unique_filenames(self, rows: List[Dict[str, Any]]) -> List[str]:
+        """
+        Pick each row's output filename, giving names that sanitize to the same
+        filename a numeric suffix so concurrent renders never write the same file.
+        """
+        # Compare case-insensitively, as macOS and Windows filesystems do
+        used = set()
+        filenames = []
+        for row in rows:
+            base_filename = filename = self.sanitize_filename(row['Common Name'])
+            suffix = 2
+            while filename.casefold() in used:
+                filename = f"{base_filename}_{suffix}"
+                suffix += 1
+            if filename != base_filename:
+                self.logger.warning(f"Output file for '{row['Common Name']}' ({row['Scientific Name']}) "
+                                    f"clashes with another plant; saving it as {filename}.stl")
+            used.add(filename.casefold())
+            filenames.append(filename)
+        return filenames
+    
+    def build_static_scad_args(self) -> List[str]:
+        """Format the -D flags for configurable parameters shared by all labels"""
+        args = []
         for param, value in self.openscad_params.items():
-            if param not in ['label_width', 'label_height']:  # Already handled above
+            if param not in ['label_width', 'label_height']:  # Set per label
                 if isinstance(value, bool):
-                    cmd.extend(["-D", f"{param}={'true' if value else 'false'}"])
+                    args.extend(["-D", f"{param}={'true' if value else 'false'}"])
                 elif isinstance(value, str):
-                    cmd.extend(["-D", f'{param}="{value}"'])
+                    args.extend(["-D", f"{param}={self.format_scad_string(value)}"])
                 else:
-                    cmd.extend(["-D", f"{param}={value}"])
+                    args.extend(["-D", f"{param}={value}"])
+        return args
+    
+    def build_openscad_command(self, plant: Any, output_file: str) -> List[str]:
+        """
+        Build OpenSCAD command using -D flags for parameter passing.
+        This eliminates the need to modify the .scad file.
+        
+        `plant` is a LabelData entry from prepare_label().
+        """
+        # Build command with -D parameters
+        cmd = ["openscad", *self.openscad_extra_args, "-o", output_file]
+        
+        # Per-label parameters
+        for param, formatter in _LABEL_ARGS:
+            cmd.append("-D")
+            cmd.append(param + "=" + formatter(getattr(plant, param)))
+        
+        # Add all configurable OpenSCAD parameters (identical for every label)
+        if self._static_scad_args is None:
+            self._static_scad_args = self.build_static_scad_args()
+        cmd.extend(self._static_scad_args)
         
         # Add the template file
         cmd.append(self.template_file)
         
         return cmd
     
-    def render_stl(self, plant_data: pd.Series, output_filename: str) -> bool:
+    def render_stl(self, plant_data: Any, output_filename: str) -> bool:
         """Use OpenSCAD to render STL file using command-line parameters"""
         stl_output = f"{self.output_dir}/{output_filename}.stl"
+        partial_stl = None
         
         try:
             # Build OpenSCAD command with -D parameters
             cmd = self.build_openscad_command(plant_data, stl_output)
             
+            # Reuse a previous render of identical inputs if there is one
+            cache_key = self.stl_cache_key(cmd, stl_output)
+            if not self.force and self.restore_cached_stl(cache_key, stl_output):
+                self.logger.info(f"✓ Reused cached render for {stl_output}")
+                return True
+            
+            # OpenSCAD writes to a uniquely named file of its own, so a failed render keeps
+            # the previous STL and no other render can swap the file out before it is cached
+            render_dir = self._cache_dir if self._cache_dir is not None else self.output_dir
+            partial_stl = os.path.join(render_dir, f"render-{uuid.uuid4().hex}.stl")
+            cmd = self.build_openscad_command(plant_data, partial_stl)
+            
             self.logger.info(f"Rendering {output_filename}.stl...")
             self.logger.debug(f"OpenSCAD command: {' '.join(cmd)}")
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            # Only stderr is needed, and only to report failures
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=120)
             
             if result.returncode == 0:
+                try:
+                    _link_into_place(self.store_cached_stl(cache_key, partial_stl), stl_output)
+                except OSError as e:
+                    # Reported here so a missing path is not mistaken for a missing OpenSCAD
+                    self.logger.error(f"✗ Could not save {stl_output}: {e}")
+                    return False
                 self.logger.info(f"✓ Successfully created {stl_output}")
                 return True
             else:
                 self.logger.error(f"✗ Failed to render {output_filename}.stl")
-                self.logger.error(f"Error: {result.stderr}")
+                self.logger.error(f"Error: {result.stderr.decode('utf-8', errors='replace')}")
                 return False
                 
         except subprocess.TimeoutExpired:
@@ -332,14 +511,140 @@ class PlantLabelGenerator:
         except Exception as e:
             self.logger.error(f"✗ Error rendering {output_filename}.stl: {e}")
             return False
+        finally:
+            if partial_stl is not None:
+                _remove_file(partial_stl)
+    
+    def stl_cache_key(self, cmd: List[str], stl_output: str) -> str:
+        """Hash everything that determines a render's result: the template, the OpenSCAD build and all its arguments"""
+        digest = hashlib.blake2b(self._template_digest.encode('utf-8'), digest_size=16)
+        digest.update(self._openscad_identity.encode('utf-8'))
+        digest.update(b'\0')
+        for arg in cmd:
+            if arg != stl_output:  # The output path does not affect the geometry
+                digest.update(arg.encode('utf-8'))
+                digest.update(b'\0')
+        return digest.hexdigest()
+    
+    def restore_cached_stl(self, cache_key: str, stl_output: str) -> bool:
+        """Link (or copy) a cached STL to the output path, returning False on a cache miss"""
+        if self._cache_dir is None:
+            return False
+        cached_stl = self._cache_dir / f"{cache_key}.stl"
+        try:
+            if cached_stl.stat().st_size == 0:
+                return False
+            _link_into_place(cached_stl, stl_output)
+        except OSError:
+            return False
+        return True
+    
+    def store_cached_stl(self, cache_key: str, rendered_stl: str) -> str:
+        """Move a fresh render into the cache for later runs, returning where the STL now is"""
+        if self._cache_dir is None:
+            return rendered_stl
+        cached_stl = self._cache_dir / f"{cache_key}.stl"
+        try:
+            # The render is complete and in the cache directory, so renaming it
+            # in is atomic and an interrupted run never leaves a truncated entry
+            os.replace(rendered_stl, cached_stl)
+        except OSError as e:
+            self.logger.warning(f"Could not cache {rendered_stl}: {e}")
+            return rendered_stl
+        return str(cached_stl)
+    
+    def _generate_and_render(self, row: Dict[str, Any], filename: str) -> bool:
+        """Prepare one label's values and render it (runs in a worker thread)"""
+        plant = self.prepare_label(row)._replace(filename=filename)
+        return self.render_stl(plant, plant.filename)
+    
+    def _openscad_fingerprint(self) -> Optional[Dict[str, Any]]:
+        """Identify the OpenSCAD binary on PATH so probe results can be reused"""
+        openscad_path = shutil.which("openscad")
+        if openscad_path is None:
+            return None
+        resolved_path = os.path.realpath(openscad_path)
+        # Launchers like snap (/snap/bin/openscad -> /usr/bin/snap) don't change
+        # when OpenSCAD is upgraded, so their files can't identify the version
+        if not os.path.basename(resolved_path).casefold().startswith('openscad'):
+            return None
+        try:
+            binary_stat = os.stat(resolved_path)
+        except OSError:
+            return None
+        return {'path': resolved_path, 'mtime_ns': binary_stat.st_mtime_ns, 'size': binary_stat.st_size}
+    
+    def _openscad_probe_cache_file(self) -> Optional[Path]:
+        """Location of the cached OpenSCAD version/options probe (None if there is no home to keep it in)"""
+        cache_home = os.environ.get('XDG_CACHE_HOME')
+        if not cache_home:
+            # An empty HOME would otherwise resolve to a cache in the filesystem root
+            if os.environ.get('HOME') == '':
+                return None
+            try:
+                cache_home = Path.home() / '.cache'
+            except RuntimeError:  # No home directory can be determined
+                return None
+        return Path(cache_home) / 'plant-labeler' / 'openscad_probe.json'
+    
+    def _load_openscad_probe(self, fingerprint: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the cached probe if it was recorded for this exact binary"""
+        cache_file = self._openscad_probe_cache_file()
+        if cache_file is None:
+            return None
+        try:
+            with open(cache_file, encoding='utf-8') as f:
+                probe = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(probe, dict) or probe.get('binary') != fingerprint:
+            return None
+        # A stale or hand-edited cache just means probing again
+        options = probe.get('options')
+        if not isinstance(probe.get('version'), str) or not isinstance(options, list) \
+                or not all(isinstance(option, str) for option in options):
+            return None
+        return probe
+    
+    def _save_openscad_probe(self, fingerprint: Dict[str, Any], version: str, options: List[str]) -> None:
+        """Remember the probe results until the OpenSCAD binary changes"""
+        cache_file = self._openscad_probe_cache_file()
+        if cache_file is None:
+            return
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump({'binary': fingerprint, 'version': version, 'options': options}, f)
+        except OSError as e:
+            self.logger.debug(f"Could not cache OpenSCAD probe: {e}")
+    
+    def _set_openscad_identity(self, fingerprint: Optional[Dict[str, Any]], version: str) -> None:
+        """Record the binary and version so upgrading OpenSCAD invalidates cached renders"""
+        self._openscad_identity = json.dumps({'binary': fingerprint, 'version': version}, sort_keys=True)
     
     def check_openscad(self) -> bool:
         """Check if OpenSCAD is available"""
+        # Skip spawning OpenSCAD when this binary has been probed before
+        fingerprint = self._openscad_fingerprint()
+        if fingerprint is not None:
+            probe = self._load_openscad_probe(fingerprint)
+            if probe is not None:
+                self.logger.info(f"OpenSCAD found: {probe['version']}")
+                self.openscad_extra_args = list(probe['options'])
+                self._set_openscad_identity(fingerprint, probe['version'])
+                return True
+        
         try:
             result = subprocess.run(["openscad", "--version"], 
                                   capture_output=True, text=True, timeout=10)
             if result.returncode == 0:
-                self.logger.info(f"OpenSCAD found: {result.stdout.strip()}")
+                # Some releases print the version to stderr
+                version = (result.stdout or result.stderr).strip()
+                self.logger.info(f"OpenSCAD found: {version}")
+                self.openscad_extra_args = self.detect_openscad_options()
+                self._set_openscad_identity(fingerprint, version)
+                if fingerprint is not None:
+                    self._save_openscad_probe(fingerprint, version, self.openscad_extra_args)
                 return True
         except:
             pass
@@ -349,30 +654,60 @@ class PlantLabelGenerator:
         self.logger.error("Make sure it's accessible from command line.")
         return False
     
+    def detect_openscad_options(self) -> List[str]:
+        """Pick optional OpenSCAD flags supported by the installed version"""
+        try:
+            result = subprocess.run(["openscad", "--help"],
+                                  capture_output=True, text=True, timeout=10)
+        except (OSError, subprocess.SubprocessError):
+            return []
+        
+        # Older releases print usage to stderr, newer ones to stdout
+        help_text = result.stdout + result.stderr
+        options = []
+        if '--quiet' in help_text:
+            # Suppress per-render progress output; errors are still reported
+            options.append('--quiet')
+        
+        # Prefer the Manifold geometry kernel, which is far faster than CGAL.
+        # Recent releases expose it as a backend; development snapshots from
+        # before that only offered it as an experimental feature.
+        if '--backend' in help_text and 'manifold' in help_text.lower():
+            options.append('--backend=manifold')
+        elif 'manifold' in help_text:
+            options.append('--enable=manifold')
+        
+        self.logger.debug(f"OpenSCAD options: {options}")
+        return options
+    
     def check_template_file(self) -> bool:
         """Check if the OpenSCAD template file exists"""
-        if not Path(self.template_file).exists():
+        if self._template_stat is None:
             self.logger.error(f"Template file '{self.template_file}' not found!")
             return False
         return True
     
-    def load_plant_data(self) -> Optional[pd.DataFrame]:
+    def load_plant_data(self) -> Optional[List[Dict[str, Any]]]:
         """Load and validate plant data from CSV file"""
         try:
-            df = pd.read_csv(self.csv_file)
-            self.logger.info(f"Loaded {len(df)} plants from {self.csv_file}")
+            # utf-8-sig strips the byte order mark spreadsheet exports often add
+            with open(self.csv_file, newline='', encoding='utf-8-sig') as f:
+                reader = csv.DictReader(f)
+                rows = list(reader)
+                columns = reader.fieldnames or []
+            self.logger.info(f"Loaded {len(rows)} plants from {self.csv_file}")
             
             # Validate data
-            clean_df, warnings = self.validate_csv_data(df)
+            clean_rows, warnings = self.validate_csv_data(rows, columns)
             
             # Report warnings
             for warning in warnings:
                 self.logger.warning(warning)
             
-            if len(clean_df) < len(df):
-                self.logger.info(f"After validation: {len(clean_df)} valid plants")
+            if len(clean_rows) < len(rows):
+                self.logger.info(f"After validation: {len(clean_rows)} valid plants")
             
-            return clean_df
+            return clean_rows
             
         except FileNotFoundError:
             self.logger.error(f"CSV file '{self.csv_file}' not found!")
@@ -397,30 +732,63 @@ class PlantLabelGenerator:
             return False
         
         # Load and validate data
-        df = self.load_plant_data()
-        if df is None or len(df) == 0:
+        rows = self.load_plant_data()
+        if not rows:
             self.logger.error("No valid plant data to process")
             return False
         
+        # Shared parameters are the same for every label, so format them once
+        self._static_scad_args = self.build_static_scad_args()
+        
+        # Create output directory; renders are cached by content inside it
+        self._cache_dir = Path(self.output_dir) / ".cache"
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            self.logger.error(f"Cannot create output directory '{self.output_dir}': {e}")
+            return False
+        try:
+            template_source = Path(self.template_file).read_bytes()
+        except OSError as e:
+            self.logger.error(f"Cannot read template file '{self.template_file}': {e}")
+            return False
+        self._template_digest = hashlib.blake2b(template_source, digest_size=16).hexdigest()
+        
         # Process each plant
         successful = 0
         failed = 0
         
-        print(f"\nGenerating labels for {len(df)} plants...")
+        print(f"\nGenerating labels for {len(rows)} plants...")
         print("-" * 60)
         
-        for index, plant in df.iterrows():
-            plant_name = plant['Common Name']
-            print(f"\n[{index+1}/{len(df)}] Processing: {plant_name}")
-            
-            # Generate filename
-            filename = self.sanitize_filename(plant_name)
-            
-            # Render STL directly using command-line parameters
-            if self.render_stl(plant, filename):
-                successful += 1
-            else:
-                failed += 1
+        # Resolve every output filename up front so no two renders share one;
+        # only the names are needed, so the labels themselves are still prepared per worker
+        filenames = self.assign_unique_filenames(rows)
+        
+        # Renders are independent OpenSCAD subprocesses, so run them concurrently.
+        # Threads are sufficient since the heavy work happens outside the GIL.
+        # Each worker prepares its own label, so rendering starts with the first row.
+        max_workers = min(self.jobs or os.cpu_count() or 1, len(rows))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}  # future -> common name, for progress reporting
+            try:
+                for row, filename in zip(rows, filenames):
+                    # Render STL directly using command-line parameters
+                    futures[executor.submit(self._generate_and_render, row, filename)] = row['Common Name']
+                
+                for done, future in enumerate(as_completed(futures), start=1):
+                    if future.result():
+                        successful += 1
+                        print(f"[{done}/{len(futures)}] ✓ {futures[future]}")
+                    else:
+                        failed += 1
+                        print(f"[{done}/{len(futures)}] ✗ {futures[future]}")
+            except KeyboardInterrupt:
+                # Drop queued renders so Ctrl-C stops the batch instead of waiting for
+                # all of it (cancel_futures= on shutdown needs Python 3.9)
+                for future in futures:
+                    future.cancel()
+                raise
         
         # Summary
         print("\n" + "=" * 60)
@@ -518,6 +886,10 @@ Examples:
     # Advanced options
     parser.add_argument('--font', default='Liberation Sans',
                        help='Font for text rendering (default: Liberation Sans)')
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                       help='Number of labels to render in parallel (default: one per CPU core)')
+    parser.add_argument('--force', action='store_true',
+                       help='Re-render all labels instead of reusing cached renders')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Enable verbose logging')
     
@@ -527,6 +899,8 @@ def main():
     """Main entry point"""
     parser = create_argument_parser()
     args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error('--jobs must be at least 1')
     
     # Setup logging level
     if args.verbose:
@@ -535,6 +909,8 @@ def main():
     # Create generator
     generator = PlantLabelGenerator(args.csv, args.template)
     generator.output_dir = args.output_dir
+    generator.force = args.force
+    generator.jobs = args.jobs
     
     # Update OpenSCAD parameters from command line arguments
     generator.openscad_params.update({